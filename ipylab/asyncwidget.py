@@ -3,15 +3,16 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import inspect
+import itertools
 import sys
 import traceback
-import uuid
 from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 from ipywidgets import Widget, register, widget_serialization
-from traitlets import Container, Dict, Instance, Set, Unicode
+from traitlets import Unicode
 
 import ipylab._frontend as _fe
 from ipylab.hasapp import HasApp
@@ -100,23 +101,6 @@ CallbackType = Callable[[dict[str, Any], Any], Any]
 TransformType = TransformMode | dict[str, str]
 
 
-class Response(asyncio.Event):
-    def set(self, payload, error: Exception | None = None) -> None:
-        if getattr(self, "_value", False):
-            msg = "Already set!"
-            raise RuntimeError(msg)
-        self.payload = payload
-        self.error = error
-        super().set()
-
-    async def wait(self) -> Any:
-        """Wait for a message and return the response."""
-        await super().wait()
-        if self.error:
-            raise self.error
-        return self.payload
-
-
 class IpylabFrontendError(IOError):
     pass
 
@@ -138,9 +122,11 @@ class AsyncWidgetBase(WidgetBase):
     _ipylab_model_register: ClassVar[dict[str, Any]] = {}
     _singleton_register: ClassVar[dict[str, str]] = {}
     SINGLETON = False
-    _ready_response = Instance(Response, ())
-    _pending_operations: Dict[str, Response] = Dict()
-    _tasks: Container[set[asyncio.Task]] = Set()
+    BATCH_OPERATIONS = False
+    TRACEBACK_LIMIT = 10  # Frames (innermost) included in errors sent to the frontend.
+    _ready = False
+    _closed = False
+    _batch_depth = 0
     _comm = None
     add_traits = None  # type: ignore # Don't support the method HasTraits.add_traits as it creates a new type that isn't a subclass of its origin)
 
@@ -157,30 +143,43 @@ class AsyncWidgetBase(WidgetBase):
     def __init__(self, *, model_id=None, **kwgs):
         if self._async_widget_base_init_complete:
             return
+        self._ready_event = asyncio.Event()
+        self._pending_operations: dict[int, asyncio.Future] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._operation_batch: list[dict] = []
         super().__init__(model_id=model_id, **kwgs)
         assert self.model_id  # noqa: S101
         self._ipylab_model_register[self.model_id] = self
         if self.SINGLETON:
             self._singleton_register[self.__class__.__name__] = self.model_id
+        self._operation_ids = itertools.count(1)  # The frontend treats 0 as a missing id.
+        self._frontend_msg_handlers = {
+            "ipylab_BE": self._on_operation_response,
+            "ipylab_FE": self._on_operation_request,
+            "init": self._on_init,
+        }
         self.on_msg(self._on_frontend_msg)
         self._async_widget_base_init_complete = True
 
     async def __aenter__(self):
-        if not self._ready_response.is_set():
+        if not self._ready:
             await self.wait_ready()
         self._check_closed()
+        return self
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
 
     def close(self):
+        self._closed = True
         self._ipylab_model_register.pop(self.model_id, None)  # type: ignore
+        # Cancelling a task cancels the future it awaits; `_send_receive` drops it from `_pending_operations`.
         for task in self._tasks:
             task.cancel()
         super().close()
 
     def _check_closed(self):
-        if not self._repr_mimebundle_:
+        if self._closed:
             msg = f"This widget is closed {self!r}"
             raise RuntimeError(msg)
 
@@ -203,9 +202,9 @@ class AsyncWidgetBase(WidgetBase):
         return None
 
     async def wait_ready(self) -> None:
-        if not self._ready_response.is_set():
+        if not self._ready:
             self.log.debug("Connecting to frontend model '%s'", self._model_name)
-            await self._ready_response.wait()
+            await self._ready_event.wait()
             self.log.debug("Connected to frontend model '%s'", self._model_name)
 
     def send(self, content, buffers=None):
@@ -214,14 +213,44 @@ class AsyncWidgetBase(WidgetBase):
         except Exception as error:
             pm.hook.on_frontend_error(obj=self, error=error, content=content, buffers=buffers)
 
-    async def _send_receive(self, content: dict, callback: CallbackType | None):
-        async with self:
-            self._pending_operations[content["ipylab_BE"]] = response = Response()
-            self.send(content)
-            return await self._wait_response_check_error(response, content, callback)
+    async def _send_receive(self, content: dict, callback: CallbackType | None, *, batch: bool):
+        # Equivalent to `async with self` without the extra coroutines once ready.
+        if not self._ready:
+            await self.wait_ready()
+        self._check_closed()
+        ipylab_BE = content["ipylab_BE"]  # noqa: N806
+        self._pending_operations[ipylab_BE] = future = asyncio.get_running_loop().create_future()
+        try:
+            self._send_operation(content, batch=batch)
+            return await self._wait_response_check_error(future, content, callback)
+        finally:
+            # Only left behind if the task was cancelled before the frontend replied.
+            self._pending_operations.pop(ipylab_BE, None)
 
-    async def _wait_response_check_error(self, response: Response, content: dict, callback: CallbackType | None) -> Any:
-        payload = await response.wait()
+    def _send_operation(self, content: dict, *, batch: bool):
+        """Send an operation request to the frontend.
+
+        With `batch`, requests sent in the same event loop iteration are
+        combined into a single message.
+        """
+        if not batch:
+            self.send(content)
+            return
+        if not self._operation_batch:
+            asyncio.get_running_loop().call_soon(self._flush_operation_batch)
+        self._operation_batch.append(content)
+
+    def _flush_operation_batch(self):
+        batch, self._operation_batch = self._operation_batch, []
+        if len(batch) == 1:
+            self.send(batch[0])
+        elif batch:
+            self.send({"batch": batch})
+
+    async def _wait_response_check_error(
+        self, future: asyncio.Future, content: dict, callback: CallbackType | None
+    ) -> Any:
+        payload = await future
         if callback:
             payload = callback(content, payload)
             if asyncio.iscoroutine(payload):
@@ -229,22 +258,43 @@ class AsyncWidgetBase(WidgetBase):
         return payload
 
     def _on_frontend_msg(self, _, content: dict, buffers: list):
+        for key, handler in self._frontend_msg_handlers.items():
+            if key in content:
+                handler(content, buffers)
+                return
+        error = self._check_get_error(content)
+        if error:
+            pm.hook.on_frontend_error(obj=self, error=error, content=content, buffers=buffers)
+
+    def _on_operation_response(self, content: dict, buffers: list):
+        """Resolve the pending operation that was scheduled by `schedule_operation`."""
         error = self._check_get_error(content)
         if error:
             pm.hook.on_frontend_error(obj=self, error=error, content=content, buffers=buffers)
-        if operation := content.get("operation"):
-            ipylab_backend = content.get("ipylab_BE", "")
-            payload = content.get("payload", {})
-            if ipylab_backend:
-                self._pending_operations.pop(ipylab_backend).set(payload, error)
-            if "ipylab_FE" in content:
-                task = asyncio.create_task(
-                    self._handle_frontend_operation(content["ipylab_FE"], operation, payload, buffers)
-                )
-                self._tasks.add(task)
-                task.add_done_callback(self._tasks.discard)
-        elif "init" in content:
-            self._ready_response.set(content)
+        future = self._pending_operations.pop(content["ipylab_BE"], None)
+        if future is not None and not future.done():
+            if error:
+                future.set_exception(error)
+            else:
+                future.set_result(content.get("payload", {}))
+
+    def _on_operation_request(self, content: dict, buffers: list):
+        """Start a task to perform an operation requested by the frontend."""
+        operation = content.get("operation")
+        if not operation:
+            return
+        task = asyncio.create_task(
+            self._handle_frontend_operation(content["ipylab_FE"], operation, content.get("payload", {}), buffers)
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _on_init(self, content: dict, buffers: list):  # noqa: ARG002
+        # The frontend sends 'init' each time a model is created for this widget
+        # (e.g. page reload); only the first one changes the state.
+        if not self._ready:
+            self._ready_event.set()
+            self._ready = True
 
     async def _handle_frontend_operation(self, ipylab_FE: str, operation: str, payload: dict, buffers: list):
         """Handle operation requests from the frontend and reply with a result."""
@@ -261,19 +311,20 @@ class AsyncWidgetBase(WidgetBase):
         except Exception as e:
             content["error"] = {
                 "repr": repr(e),
-                "traceback": traceback.format_tb(e.__traceback__),
+                "traceback": traceback.format_tb(e.__traceback__, -self.TRACEBACK_LIMIT),
             }
             pm.hook.on_frontend_error(obj=self, error=e, content=content, buffers=buffers)
         finally:
+            # Call Widget.send directly so a failure is reported once, here, with a reply sent.
             try:
-                self.send(content, buffers)
-            except ValueError as e:
+                super().send(content, buffers)
+            except Exception as e:
                 content.pop("payload", None)
                 content["error"] = {
                     "repr": repr(e),
-                    "traceback": traceback.format_tb(e.__traceback__),
+                    "traceback": traceback.format_tb(e.__traceback__, -self.TRACEBACK_LIMIT),
                 }
-                self.send(content, buffers)
+                self.send(content)
                 pm.hook.on_frontend_error(obj=self, error=e, content=content, buffers=buffers)
 
     async def _do_operation_for_frontend(self, operation: str, payload: dict, buffers: list):  # noqa: ARG002
@@ -308,25 +359,43 @@ class AsyncWidgetBase(WidgetBase):
         if not operation or not isinstance(operation, str):
             msg = f"Invalid {operation=}"
             raise ValueError(msg)
-        if isinstance(transform, str):
-            TransformMode(transform)
-        else:
-            TransformMode(transform["mode"])
-        ipylab_BE = str(uuid.uuid4())  # noqa: N806
+        if not isinstance(transform, TransformMode):
+            TransformMode(transform if isinstance(transform, str) else transform["mode"])
+        if callback and not callable(callback):
+            msg = f"callback is not callable {callback!r}"
+            raise TypeError(msg)
+        ipylab_BE = next(self._operation_ids)  # noqa: N806
         content = {
             "ipylab_BE": ipylab_BE,
             "operation": operation,
             "kwgs": kwgs,
             "transform": transform,
         }
-        if callback and not callable(callback):
-            msg = f"callback is not callable {callback!r}"
-            raise TypeError(msg)
-        task = asyncio.create_task(self._send_receive(content, callback))
+        batch = self.BATCH_OPERATIONS or self._batch_depth > 0
+        task = asyncio.create_task(self._send_receive(content, callback, batch=batch))
         self._tasks.add(task)
         task.add_done_callback(self._tasks.discard)
         return task
 
+    @contextlib.contextmanager
+    def batch_operations(self):
+        """Send operations scheduled inside this context to the frontend in batches.
+
+        Operations that become ready to send in the same event loop iteration
+        are combined into one message (see also `BATCH_OPERATIONS`).
+
+        ```
+        with app.batch_operations():
+            app.shell.expandLeft()
+            app.shell.expandRight()
+        ```
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
     def executeMethod(
         self,
         method: str,
@@ -352,11 +421,6 @@ class AsyncWidgetBase(WidgetBase):
         """
 
         # This operation is sent to the frontend function _fe_execute in 'ipylab/src/widgets/ipylab.ts'
-
-        # validation
-        if callback is not None and not callable(callback):
-            msg = "callback must be a callable or None"
-            raise TypeError(msg)
         return self.schedule_operation(
             operation="FE_execute",
             FE_execute={
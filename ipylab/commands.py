@@ -5,7 +5,7 @@ from __future__ import annotations
 import inspect
 from typing import TYPE_CHECKING, Any
 
-from traitlets import Dict, Tuple, Unicode
+from traitlets import Tuple, Unicode
 
 from ipylab.asyncwidget import AsyncWidgetBase, TransformMode, pack, register
 from ipylab.hookspecs import pm
@@ -41,18 +41,24 @@ class CommandRegistry(AsyncWidgetBase):
     _model_name = Unicode("CommandRegistryModel").tag(sync=True)
     SINGLETON = True
     commands = Tuple(read_only=True).tag(sync=True)
-    _execute_callbacks: Dict[str, Callable[[], None]] = Dict()
+
+    def __init__(self, **kwgs):
+        if self._async_widget_base_init_complete:
+            return
+        self._execute_callbacks: dict[str, Callable] = {}
+        self._execute_parameters: dict[str, frozenset[str]] = {}
+        super().__init__(**kwgs)
 
     async def _do_operation_for_frontend(self, operation: str, payload: dict, buffers: list) -> Any:
         match operation:
             case "execute":
                 command_id: str = payload.get("id")  # type:ignore
                 cmd = self._get_command(command_id)
-                kwgs = payload.get("kwgs") or {} | {"buffers": buffers}
-                for k in set(kwgs).difference(inspect.signature(cmd).parameters.keys()):
-                    kwgs.pop(k)
+                kwgs = (payload.get("kwgs") or {}) | {"buffers": buffers}
+                parameters = self._execute_parameters[command_id]
+                kwgs = {k: v for k, v in kwgs.items() if k in parameters}
                 result = cmd(**kwgs)
-                if inspect.isawaitable(result):
+                if hasattr(type(result), "__await__"):
                     return await result
                 return result
             case _:
@@ -79,7 +85,8 @@ class CommandRegistry(AsyncWidgetBase):
         **kwgs,
     ):
         # TODO: support other parameters (isEnabled, isVisible...)
-        self._execute_callbacks = self._execute_callbacks | {command_id: execute}
+        self._execute_callbacks[command_id] = execute
+        self._execute_parameters[command_id] = frozenset(inspect.signature(execute).parameters)
         return self.schedule_operation(
             "addPythonCommand",
             id=command_id,
@@ -99,5 +106,6 @@ class CommandRegistry(AsyncWidgetBase):
 
         def callback(content: dict, payload: list):  # noqa: ARG001
             self._execute_callbacks.pop(command_id, None)
+            self._execute_parameters.pop(command_id, None)
 
         return self.schedule_operation("removePythonCommand", command_id=command_id, callback=callback, **kwgs)
@@ -3,12 +3,12 @@
 
 from __future__ import annotations
 
+import functools
+
 import ipylab
 
 
 class HasApp:
-    @property
+    @functools.cached_property
     def app(self) -> ipylab.JupyterFrontEnd:
-        if not hasattr(self, "_app"):
-            self._app = ipylab.JupyterFrontEnd()
-        return self._app
+        return ipylab.JupyterFrontEnd()
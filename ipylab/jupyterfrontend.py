@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
+import functools
 from typing import TYPE_CHECKING, Any
 
 from traitlets import Dict, Instance, Tuple, Unicode
@@ -20,6 +20,11 @@ if TYPE_CHECKING:
     from collections.abc import Callable
 
 
+@functools.lru_cache(maxsize=128)
+def _compile_code(source: str, mode: str) -> types.CodeType:
+    return compile(source, "<execEval>", mode)
+
+
 @register
 class JupyterFrontEnd(AsyncWidgetBase):
     _model_name = Unicode("JupyterFrontEndModel").tag(sync=True)
@@ -34,33 +39,25 @@ class JupyterFrontEnd(AsyncWidgetBase):
     current_session = Dict(read_only=True).tag(sync=True)
     all_sessions = Tuple(read_only=True).tag(sync=True)
 
-    @property
+    @functools.cached_property
     def dialog(self) -> Dialog:
-        if not hasattr(self, "_dialog"):
-            self._dialog = Dialog()
-        return self._dialog
+        return Dialog()
 
-    @property
+    @functools.cached_property
     def file_dialog(self) -> FileDialog:
-        if not hasattr(self, "_fileDialog"):
-            self._fileDialog = FileDialog()
-        return self._fileDialog
+        return FileDialog()
 
-    @property
+    @functools.cached_property
     def shell(self) -> Shell:
-        if not hasattr(self, "_shell"):
-            self._shell = Shell()
-        return self._shell
+        return Shell()
 
-    @property
+    @functools.cached_property
     def sessionManager(self) -> SessionManager:
-        if not hasattr(self, "_sessionManger"):
-            self._sessionManger = SessionManager()
-        return self._sessionManger
+        return SessionManager()
 
     async def wait_ready(self, timeout=5):
         """Wait until connected to app indicates it is ready."""
-        if not self._ready_response.is_set():
+        if not self._ready:
             future = asyncio.gather(
                 super().wait_ready(),
                 self.command.wait_ready(),
@@ -220,16 +217,20 @@ class JupyterFrontEnd(AsyncWidgetBase):
         # TODO: consider if globals / locals / async scope should be supported.
         code = payload.get("code")
         user_expressions = payload.get("user_expressions") or {}
-        locals_ = payload | {"buffers": buffers}
+        locals_ = dict(payload, buffers=buffers)
         if code:
+            if isinstance(code, str):
+                code = _compile_code(code, "exec")
             exec(code, None, locals_)  # noqa: S102
         if user_expressions:
             results = {}
             for name, expression in user_expressions.items():
+                if isinstance(expression, str):
+                    expression = _compile_code(expression, "eval")  # noqa: PLW2901
                 result = eval(expression, None, locals_)  # noqa: S307
                 if callable(result):
                     result = result()
-                if inspect.isawaitable(result):
+                if hasattr(type(result), "__await__"):
                     result = await result
                 results[name] = result
             return results
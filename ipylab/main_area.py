@@ -142,7 +142,7 @@ class MainArea(AsyncWidgetBase, HasApp):
         Opening the console will close any existing consoles.
         """
         self.set_trait("console_status", ViewStatus.loading)
-        kwgs = {"name": self.name, "path": self.path} | kwgs
+        kwgs = {"name": self.name, "path": self.path, **kwgs}
         return self.schedule_operation("open_console", insertMode=InsertMode(mode), **kwgs)  # type: ignore
 
     def unload_console(self) -> asyncio.Task:
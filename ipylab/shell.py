@@ -81,15 +81,14 @@ class Shell(JupyterFrontEndSubsection):
             mode: InsertMode
             https://jupyterlab.readthedocs.io/en/latest/api/interfaces/docregistry.DocumentRegistry.IOpenOptions.html
         """
-        options_ = {
+        options = {
             "activate": activate,
             "mode": mode,
             "rank": int(rank) if rank else None,
             "ref": ref or self.app.current_widget_id,
+            **options,
         }
-        return self.app.schedule_operation(
-            "addToShell", serializedWidget=pack(widget), area=area, options=options_ | options
-        )
+        return self.app.schedule_operation("addToShell", serializedWidget=pack(widget), area=area, options=options)
 
     def expandLeft(self) -> asyncio.Task:
         return self.executeMethod("expandLeft")
@@ -75,10 +75,15 @@ export class IpylabModel extends DOMWidgetModel {
    * There are two types:
    * 1. Response to requested operation sent to Python backend (ipylab_FE).
    * 2. Operation requests received from the Python backend (ipylab_BE).
+   * Messages of either type may also arrive together in a `batch` array.
    * @param msg
    */
   private _onCustomMessage(msg: any) {
-    if (msg.ipylab_FE) {
+    if (msg.batch) {
+      for (const item of msg.batch) {
+        this._onCustomMessage(item);
+      }
+    } else if (msg.ipylab_FE) {
       // Frontend operation result
       const opDone = this._pendingBackendOperations.get(msg.ipylab_FE);
       this._pendingBackendOperations.delete(msg.ipylab_FE);
@@ -98,12 +103,12 @@ export class IpylabModel extends DOMWidgetModel {
    * Perform an operation for the backend returning the result if successful
    * or an error 'message' if unsuccessful.
    * Results are 'transformed' by the method specified in the call to the operation from the backend.
-   * The transformed result is returned to the backend using the ipylab_BE value (uuid4).
+   * The transformed result is returned to the backend using the ipylab_BE value (unique per operation).
    * @param msg
    */
   private async _do_operation_for_backend(msg: any) {
     const operation: string = msg.operation;
-    const ipylab_BE: string = msg.ipylab_BE;
+    const ipylab_BE: number = msg.ipylab_BE;
     const transform: object | string = msg.transform;
 
     try {